@@ -5,63 +5,268 @@ Scans for installed AI applications, CLI tools, and configurations
 """
 
 import os
+import re
 import sys
+import stat
 import json
 import plistlib
+import xml.sax
 import subprocess
 import shutil
 import argparse
+import threading
 import hashlib
+import heapq
+import functools
+import itertools
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple, Any
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+try:
+    import orjson
+except ImportError:  # Optional; stdlib json is used when not installed
+    orjson = None
 
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dump(obj: Any, f: TextIO, pretty: bool = False) -> None:
+    """
+    Write obj as JSON to a text file object without first building the whole
+    document as a str. orjson output is written straight to the underlying
+    binary buffer; stdlib json streams chunks via json.dump.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        buffer = getattr(f, 'buffer', None)
+        if buffer is not None:
+            f.flush()
+            buffer.write(data)
+            buffer.flush()
+        else:
+            f.write(data.decode('utf-8'))
+        return
+    json.dump(obj, f, indent=2 if pretty else None)
+
+
+# JSON string literals (an unterminated one runs to end of input, so it is
+# consumed in a single pass), and every byte that is not an array/object bracket
+_JSON_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"?')
+_JSON_NON_BRACKETS = bytes(set(range(256)) - set(b'[]{}'))
+
+
+def _json_nesting_depth(data: bytes) -> int:
+    """
+    Return the maximum array/object nesting depth of a JSON document without
+    parsing it, so pathologically nested input can be rejected before a
+    recursive decoder sees it.
+    """
+    brackets = _JSON_STRING.sub(b'', data).translate(None, _JSON_NON_BRACKETS)
+    depths = itertools.accumulate(1 if c in b'[{' else -1 for c in brackets)
+    return max(depths, default=0)
+
+
+# Current user's home directory, resolved once (expanduser may consult pwd)
+_HOME = os.path.expanduser('~')
+_HOME_PREFIX = _HOME.rstrip(os.sep)
+
+
+def _expand_user(path: str) -> str:
+    """os.path.expanduser using the cached home directory for ~ and ~/..."""
+    if path == '~':
+        return _HOME
+    if path.startswith('~/'):
+        return _HOME_PREFIX + path[1:]
+    if path.startswith('~'):
+        # ~otheruser: defer to the stdlib lookup
+        return os.path.expanduser(path)
+    return path
+
+
+@functools.lru_cache(maxsize=1024)
 def _anonymize_identifier(value: str) -> str:
     """
-    Return a deterministic, PII-safe identifier: first 4 chars + last 8 of MD5.
-    Same input always produces the same output for correlation by a SaaS.
+    Return a deterministic, PII-safe identifier: first 4 chars + 8 hex chars
+    of a 4-byte BLAKE2b digest. Same input always produces the same output for
+    correlation by a SaaS.
     """
-    if not value or not value.strip():
-        value = 'unknown'
-    value = value.strip()
-    prefix = value[:4] if len(value) >= 4 else value
-    digest = hashlib.md5(value.encode('utf-8')).hexdigest()
-    return f"{prefix}{digest[-8:]}"
+    value = (value or '').strip() or 'unknown'
+    digest = hashlib.blake2b(value.encode('utf-8'), digest_size=4).hexdigest()
+    return f"{value[:4]}{digest}"
 
 
 def _anonymize_hostname(hostname: str) -> str:
-    """Strip .local and anonymize like other identifiers."""
+    """Lowercase, strip a trailing .local and anonymize like other identifiers."""
     if not hostname:
         return _anonymize_identifier('unknown')
-    base = hostname.lower().rstrip('.local') if hostname.lower().endswith('.local') else hostname
-    return _anonymize_identifier(base)
+    return _anonymize_identifier(hostname.lower().removesuffix('.local'))
 
 
 def _sanitize_paths_in_output(obj: Any, real_home: str, anonymized_home: str) -> None:
     """
-    Recursively replace real user home path with anonymized path in all string
-    values (in-place). Removes username PII from paths in scan output.
+    Replace real user home path with anonymized path in all string values
+    (in-place). Removes username PII from paths in scan output. Walks the tree
+    with an explicit stack so deeply nested output cannot hit the recursion limit.
     """
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if isinstance(v, str) and real_home in v:
-                obj[k] = v.replace(real_home, anonymized_home)
-            else:
-                _sanitize_paths_in_output(v, real_home, anonymized_home)
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj):
-            if isinstance(item, str) and real_home in item:
-                obj[i] = item.replace(real_home, anonymized_home)
-            else:
-                _sanitize_paths_in_output(item, real_home, anonymized_home)
+    if not real_home or real_home == anonymized_home:
+        return
+
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            items = current.items()
+        elif isinstance(current, list):
+            items = enumerate(current)
+        else:
+            continue
+        for k, v in items:
+            if type(v) is str:
+                # Plain substring test + str.replace beats re.sub or a
+                # startswith/slice fast path on short path strings.
+                if real_home in v:
+                    current[k] = v.replace(real_home, anonymized_home)
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
+
+
+# Maximum number of file names reported per configuration directory (privacy)
+MAX_LISTED_FILES = 20
+
+
+def _summarize_directory(path: str, limit: int = MAX_LISTED_FILES) -> Tuple[int, List[str]]:
+    """
+    Return (entry count, first `limit` entry names in sorted order) for a
+    directory in one scandir pass, without holding or sorting the full listing.
+    """
+    count = 0
+
+    def names(entries):
+        nonlocal count
+        for entry in entries:
+            count += 1
+            yield entry.name
+
+    with os.scandir(path) as entries:
+        files = heapq.nsmallest(limit, names(entries))
+    return count, files
+
+
+class _PlistKeysFound(Exception):
+    """Raised by _PlistKeyHandler to stop parsing once all keys are captured."""
+
+
+class _PlistKeyHandler(xml.sax.handler.ContentHandler):
+    """
+    SAX handler that captures scalar values for selected top-level keys of an
+    XML plist, without building the rest of the document.
+    """
+
+    # Element depth of children of the root <dict> (plist > dict > child)
+    TOP_LEVEL_DEPTH = 3
+
+    SCALARS = {
+        'string': str,
+        'integer': int,
+        'real': float,
+        'true': lambda _: True,
+        'false': lambda _: False,
+    }
+
+    def __init__(self, keys: Iterable[str]):
+        super().__init__()
+        self.wanted = set(keys)
+        self.values: Dict[str, Any] = {}
+        self._stack: List[str] = []
+        self._text: List[str] = []
+        self._next_key: Optional[str] = None
+        self._value_key: Optional[str] = None
+
+    def _at_top_level(self) -> bool:
+        return len(self._stack) == self.TOP_LEVEL_DEPTH and self._stack[1] == 'dict'
+
+    def startElement(self, name, attrs):
+        self._stack.append(name)
+        if self._at_top_level():
+            self._text = []
+            if name != 'key':
+                self._value_key, self._next_key = self._next_key, None
+
+    def characters(self, content):
+        if self._at_top_level():
+            self._text.append(content)
+
+    def endElement(self, name):
+        if self._at_top_level():
+            text = ''.join(self._text)
+            if name == 'key':
+                self._next_key = text if text in self.wanted else None
+            elif self._value_key is not None:
+                convert = self.SCALARS.get(name)
+                if convert is not None:
+                    try:
+                        self.values[self._value_key] = convert(text)
+                    except ValueError:
+                        pass
+                self._value_key = None
+                if len(self.values) == len(self.wanted):
+                    raise _PlistKeysFound()
+        self._stack.pop()
+
+
+def _read_xml_plist_keys(data: bytes, keys: Iterable[str]) -> Dict[str, Any]:
+    """
+    Return the requested top-level scalar keys from an XML plist. Parsing stops
+    as soon as every key has been seen; missing or non-scalar keys are omitted.
+    """
+    handler = _PlistKeyHandler(keys)
+    try:
+        xml.sax.parseString(data, handler)
+    except _PlistKeysFound:
+        pass
+    return handler.values
 
 
 class ScannerConfig:
     """Manages scanner configuration from JSON file"""
 
+    # Largest and most deeply nested remote configuration accepted by update_from_url
+    MAX_REMOTE_CONFIG_BYTES = 1 << 20
+    MAX_REMOTE_CONFIG_DEPTH = 32
+
+    # Config sections and the fields scanners read from each entry, as
+    # field -> (expected type, required). list fields must hold only strings.
+    SECTION_FIELDS = {
+        'applications': {
+            'name': (str, True),
+            'vendor': (str, True),
+        },
+        'cli_tools': {
+            'name': (str, True),
+            'vendor': (str, True),
+            'version_cmd': (list, False),
+            'config_paths': (list, False),
+        },
+        'config_locations': {
+            'name': (str, True),
+            'paths': (list, True),
+        },
+        'vscode_extensions': {
+            'id': (str, False),
+            'name': (str, False),
+            'vendor': (str, False),
+        },
+    }
+
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
         self.config = self._load_config()
@@ -71,7 +276,7 @@ class ScannerConfig:
         # Check in order: current dir, ~/.config, /usr/local/etc
         possible_paths = [
             'scanner_config.json',
-            os.path.expanduser('~/.config/aiapp-scanner/config.json'),
+            _expand_user('~/.config/aiapp-scanner/config.json'),
             '/usr/local/etc/aiapp-scanner/config.json'
         ]
 
@@ -80,14 +285,14 @@ class ScannerConfig:
                 return path
 
         # Return user config location as default for new installs
-        return os.path.expanduser('~/.config/aiapp-scanner/config.json')
+        return _expand_user('~/.config/aiapp-scanner/config.json')
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file. Config file must exist."""
         if not os.path.exists(self.config_path):
             _possible = [
                 'scanner_config.json',
-                os.path.expanduser('~/.config/aiapp-scanner/config.json'),
+                _expand_user('~/.config/aiapp-scanner/config.json'),
                 '/usr/local/etc/aiapp-scanner/config.json'
             ]
             print(
@@ -97,8 +302,8 @@ class ScannerConfig:
             )
             sys.exit(1)
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            with open(self.config_path, 'rb') as f:
+                return _json_loads(f.read())
         except json.JSONDecodeError as e:
             print(f"Error parsing config file: {e}", file=sys.stderr)
             sys.exit(1)
@@ -110,7 +315,7 @@ class ScannerConfig:
             os.makedirs(config_dir, exist_ok=True)
 
         with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+            _json_dump(self.config, f, pretty=True)
 
     def update_from_url(self, url: Optional[str] = None) -> bool:
         """Update configuration from remote URL"""
@@ -122,10 +327,23 @@ class ScannerConfig:
         try:
             req = Request(update_url, headers={'User-Agent': 'aiapp-scanner/1.0'})
             with urlopen(req, timeout=10) as response:
-                new_config = json.loads(response.read().decode('utf-8'))
+                # Read at most one byte past the limit so oversize bodies are
+                # rejected without buffering them
+                data = response.read(self.MAX_REMOTE_CONFIG_BYTES + 1)
+            if len(data) > self.MAX_REMOTE_CONFIG_BYTES:
+                print(
+                    f"Configuration from URL exceeds {self.MAX_REMOTE_CONFIG_BYTES} bytes",
+                    file=sys.stderr
+                )
+                return False
+            if _json_nesting_depth(data) > self.MAX_REMOTE_CONFIG_DEPTH:
+                print("Configuration from URL is too deeply nested", file=sys.stderr)
+                return False
+
+            new_config = _json_loads(data)
 
             # Validate new config has required fields
-            if 'applications' in new_config or 'cli_tools' in new_config or 'vscode_extensions' in new_config:
+            if self._is_valid_config(new_config):
                 # Backup old config
                 backup_path = f"{self.config_path}.bak"
                 if os.path.exists(self.config_path):
@@ -139,42 +357,147 @@ class ScannerConfig:
                 print("Invalid configuration format from URL", file=sys.stderr)
                 return False
 
-        except (URLError, HTTPError, json.JSONDecodeError) as e:
+        except (URLError, HTTPError, json.JSONDecodeError, UnicodeDecodeError, RecursionError) as e:
             print(f"Failed to update configuration: {e}", file=sys.stderr)
             return False
 
+    @classmethod
+    def _is_valid_config(cls, config: Any) -> bool:
+        """
+        Check a parsed configuration has at least one scan section and that
+        every section present is a list of objects whose fields have the types
+        scanners rely on, so a saved update cannot crash a later scan.
+        """
+        if not isinstance(config, dict):
+            return False
+        if not any(k in config for k in ('applications', 'cli_tools', 'vscode_extensions')):
+            return False
+        for section, fields in cls.SECTION_FIELDS.items():
+            entries = config.get(section, [])
+            if not isinstance(entries, list):
+                return False
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    return False
+                for field, (expected_type, required) in fields.items():
+                    if field not in entry:
+                        if required:
+                            return False
+                        continue
+                    value = entry[field]
+                    if not isinstance(value, expected_type):
+                        return False
+                    if expected_type is list and not all(isinstance(v, str) for v in value):
+                        return False
+        return True
+
+
+class PathInfoCache:
+    """
+    Remembers stat and directory-summary results per expanded path, so a
+    location referenced by several scanners (e.g. a CLI tool config_path that
+    is also a config_location) is only read from disk once per scan.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        # path -> Future resolving to the path info; a path is claimed under
+        # the lock, so concurrent callers wait on the first reader's result
+        self._entries: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Forget all cached results (called at the start of each scan)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return cached path info, or None if the path does not exist"""
+        if not self.enabled:
+            return self._describe(path)
+        with self._lock:
+            future = self._entries.get(path)
+            is_reader = future is None
+            if is_reader:
+                future = Future()
+                self._entries[path] = future
+        if is_reader:
+            try:
+                future.set_result(self._describe(path))
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+        return future.result()
+
+    @staticmethod
+    def _describe(path: str) -> Optional[Dict[str, Any]]:
+        """Stat a path once and summarize it if it is a directory"""
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+        if not stat.S_ISDIR(st.st_mode):
+            return {
+                'is_dir': False,
+                'size': st.st_size,
+                'modified': datetime.fromtimestamp(st.st_mtime).isoformat()
+            }
+        try:
+            file_count, files = _summarize_directory(path)
+        except PermissionError:
+            return {'is_dir': True, 'error': 'permission_denied'}
+        return {'is_dir': True, 'file_count': file_count, 'files': files}
+
 
 class ApplicationScanner:
     """Scans for GUI applications"""
 
+    # Info.plist keys reported for each application
+    INFO_PLIST_KEYS = ('CFBundleShortVersionString', 'CFBundleVersion', 'CFBundleIdentifier')
+
     def __init__(self, config: ScannerConfig):
         self.config = config
         self.app_dirs = [
             '/Applications',
-            os.path.expanduser('~/Applications'),
+            _expand_user('~/Applications'),
             '/System/Applications'
         ]
+        self._known_apps_source = None
+        self._known_apps: Dict[str, Dict] = {}
+
+    def _get_known_apps(self) -> Dict[str, Dict]:
+        """
+        Map of bundle name to config entry for known .app bundles. Built once
+        and rebuilt only if the configured application list is replaced (e.g.
+        by update_from_url).
+        """
+        applications = self.config.config.get('applications', [])
+        if applications is not self._known_apps_source:
+            self._known_apps = {
+                app['name']: app for app in applications
+                if isinstance(app.get('name'), str) and app['name'].endswith('.app')
+            }
+            self._known_apps_source = applications
+        return self._known_apps
 
     def scan(self) -> List[Dict[str, Any]]:
         """Scan for known AI applications"""
         found_apps = []
-        known_apps = {app['name']: app for app in self.config.config.get('applications', [])}
+        known_apps = self._get_known_apps()
 
         for app_dir in self.app_dirs:
-            if not os.path.exists(app_dir):
-                continue
-
             try:
-                for item in os.listdir(app_dir):
-                    if not item.endswith('.app'):
-                        continue
-
-                    if item in known_apps:
-                        app_path = os.path.join(app_dir, item)
-                        app_info = self._get_app_info(app_path, known_apps[item])
-                        if app_info:
-                            found_apps.append(app_info)
-            except PermissionError:
+                # scandir yields name and full path without a stat per entry
+                with os.scandir(app_dir) as entries:
+                    for entry in entries:
+                        # Known names all end in .app, so one lookup filters both
+                        known_info = known_apps.get(entry.name)
+                        if known_info:
+                            app_info = self._get_app_info(entry.path, known_info)
+                            if app_info:
+                                found_apps.append(app_info)
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
                 continue
 
         return found_apps
@@ -183,12 +506,15 @@ class ApplicationScanner:
         """Extract application information from Info.plist"""
         info_plist_path = os.path.join(app_path, 'Contents/Info.plist')
 
-        if not os.path.exists(info_plist_path):
-            return None
-
         try:
             with open(info_plist_path, 'rb') as f:
-                plist = plistlib.load(f)
+                data = f.read()
+            # Binary plists use plistlib's decoder; for XML only the keys we
+            # report are extracted, stopping once all of them are found.
+            if data.startswith(b'bplist'):
+                plist = plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+            else:
+                plist = _read_xml_plist_keys(data, self.INFO_PLIST_KEYS)
 
             return {
                 'type': 'application',
@@ -200,6 +526,9 @@ class ApplicationScanner:
                 'path': app_path,
                 'install_location': os.path.dirname(app_path)
             }
+        except (FileNotFoundError, NotADirectoryError):
+            # No Info.plist; not a bundle we can report on
+            return None
         except Exception as e:
             print(f"Error reading {info_plist_path}: {e}", file=sys.stderr)
             return None
@@ -208,47 +537,64 @@ class ApplicationScanner:
 class CLIToolScanner:
     """Scans for CLI tools"""
 
-    def __init__(self, config: ScannerConfig):
+    def __init__(self, config: ScannerConfig, path_cache: Optional[PathInfoCache] = None):
         self.config = config
+        self.path_cache = path_cache or PathInfoCache(enabled=False)
+
+    # Upper bound on concurrent version commands
+    MAX_VERSION_WORKERS = 8
 
     def scan(self) -> List[Dict[str, Any]]:
         """Scan for known CLI tools"""
-        found_tools = []
-
+        installed = []
         for tool in self.config.config.get('cli_tools', []):
-            tool_info = self._check_tool(tool)
-            if tool_info:
-                found_tools.append(tool_info)
-
-        return found_tools
-
-    def _check_tool(self, tool_config: Dict) -> Optional[Dict[str, Any]]:
-        """Check if CLI tool is installed and get version"""
-        tool_name = tool_config['name']
-        tool_path = shutil.which(tool_name)
-
-        if not tool_path:
-            return None
+            tool_path = shutil.which(tool['name'])
+            if tool_path:
+                installed.append((tool, tool_path))
+
+        if not installed:
+            return []
+
+        # Version commands are independent subprocesses; run them concurrently
+        # so total wait is the slowest tool rather than the sum of all tools.
+        workers = min(self.MAX_VERSION_WORKERS, len(installed))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            versions = list(executor.map(
+                self._get_version,
+                [tool for tool, _ in installed],
+                [tool_path for _, tool_path in installed]
+            ))
+
+        return [
+            self._build_tool_info(tool, tool_path, version)
+            for (tool, tool_path), version in zip(installed, versions)
+        ]
 
-        version = self._get_version(tool_config)
+    def _build_tool_info(self, tool_config: Dict, tool_path: str, version: str) -> Dict[str, Any]:
+        """Build result entry for an installed CLI tool"""
         config_info = self._check_config(tool_config.get('config_paths', []))
 
         return {
             'type': 'cli_tool',
-            'name': tool_name,
+            'name': tool_config['name'],
             'vendor': tool_config['vendor'],
             'path': tool_path,
             'version': version,
             'configurations': config_info
         }
 
-    def _get_version(self, tool_config: Dict) -> str:
+    def _get_version(self, tool_config: Dict, tool_path: Optional[str] = None) -> str:
         """Get version information for CLI tool"""
         version_cmd = tool_config.get('version_cmd', [])
 
         if not version_cmd:
             return 'unknown'
 
+        # Run the already-resolved absolute path so the command is not
+        # searched for on PATH again
+        if tool_path and version_cmd[0] == tool_config['name']:
+            version_cmd = [tool_path] + list(version_cmd[1:])
+
         try:
             result = subprocess.run(
                 version_cmd,
@@ -270,31 +616,29 @@ class CLIToolScanner:
         configs = []
 
         for path in config_paths:
-            expanded_path = os.path.expanduser(path)
-            if os.path.exists(expanded_path):
-                config_info = {
-                    'path': expanded_path,
-                    'exists': True
-                }
+            expanded_path = _expand_user(path)
+            path_info = self.path_cache.get(expanded_path)
+            if path_info is None:
+                continue
 
-                if os.path.isdir(expanded_path):
-                    try:
-                        files = os.listdir(expanded_path)
-                        config_info['type'] = 'directory'
-                        config_info['file_count'] = len(files)
-                        config_info['files'] = sorted(files)[:20] # Limit for privacy
-                    except PermissionError:
-                        config_info['error'] = 'permission_denied'
+            config_info = {
+                'path': expanded_path,
+                'exists': True
+            }
+
+            if path_info['is_dir']:
+                if 'error' in path_info:
+                    config_info['error'] = path_info['error']
                 else:
-                    config_info['type'] = 'file'
-                    try:
-                        stat = os.stat(expanded_path)
-                        config_info['size'] = stat.st_size
-                        config_info['modified'] = datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    except Exception:
-                        pass
+                    config_info['type'] = 'directory'
+                    config_info['file_count'] = path_info['file_count']
+                    config_info['files'] = list(path_info['files'])
+            else:
+                config_info['type'] = 'file'
+                config_info['size'] = path_info['size']
+                config_info['modified'] = path_info['modified']
 
-                configs.append(config_info)
+            configs.append(config_info)
 
         return configs
 
@@ -302,8 +646,9 @@ class CLIToolScanner:
 class ConfigurationScanner:
     """Scans for standalone configuration directories"""
 
-    def __init__(self, config: ScannerConfig):
+    def __init__(self, config: ScannerConfig, path_cache: Optional[PathInfoCache] = None):
         self.config = config
+        self.path_cache = path_cache or PathInfoCache(enabled=False)
 
     def scan(self) -> List[Dict[str, Any]]:
         """Scan for configuration directories"""
@@ -311,28 +656,28 @@ class ConfigurationScanner:
 
         for config_location in self.config.config.get('config_locations', []):
             for path in config_location['paths']:
-                expanded_path = os.path.expanduser(path)
-                if os.path.exists(expanded_path):
-                    config_info = {
-                        'type': 'configuration',
-                        'name': config_location['name'],
-                        'path': expanded_path,
-                        'exists': True
-                    }
+                expanded_path = _expand_user(path)
+                path_info = self.path_cache.get(expanded_path)
+                if path_info is None:
+                    continue
 
-                    try:
-                        if os.path.isdir(expanded_path):
-                            files = os.listdir(expanded_path)
-                            config_info['file_count'] = len(files)
-                            config_info['files'] = sorted(files)[:20]
-                        else:
-                            stat = os.stat(expanded_path)
-                            config_info['size'] = stat.st_size
-
-                        found_configs.append(config_info)
-                    except PermissionError:
-                        config_info['error'] = 'permission_denied'
-                        found_configs.append(config_info)
+                config_info = {
+                    'type': 'configuration',
+                    'name': config_location['name'],
+                    'path': expanded_path,
+                    'exists': True
+                }
+
+                if path_info['is_dir']:
+                    if 'error' in path_info:
+                        config_info['error'] = path_info['error']
+                    else:
+                        config_info['file_count'] = path_info['file_count']
+                        config_info['files'] = list(path_info['files'])
+                else:
+                    config_info['size'] = path_info['size']
+
+                found_configs.append(config_info)
 
         return found_configs
 
@@ -341,8 +686,8 @@ class VSCodeExtensionScanner:
     """Scans for AI-related extensions in VSCode extension directories."""
 
     EXTENSION_DIRS = [
-        (os.path.expanduser('~/.vscode/extensions'), 'vscode'),
-        (os.path.expanduser('~/.vscode-insiders/extensions'), 'vscode-insiders'),
+        (_expand_user('~/.vscode/extensions'), 'vscode'),
+        (_expand_user('~/.vscode-insiders/extensions'), 'vscode-insiders'),
     ]
 
     def __init__(self, config: ScannerConfig):
@@ -351,33 +696,55 @@ class VSCodeExtensionScanner:
     def scan(self) -> List[Dict[str, Any]]:
         """Scan for configured VSCode extensions (e.g. roocode)."""
         found = []
-        wanted = self.config.config.get('vscode_extensions', [])
+        # publisher -> lowercased extension id -> config entry
+        wanted_by_publisher: Dict[str, Dict[str, Dict]] = {}
+        for ext_cfg in self.config.config.get('vscode_extensions', []):
+            ext_id = (ext_cfg.get('id') or ext_cfg.get('name', '')).lower()
+            if ext_id and '.' in ext_id:
+                publisher = ext_id.split('.', 1)[0]
+                wanted_by_publisher.setdefault(publisher, {}).setdefault(ext_id, ext_cfg)
+
+        if not wanted_by_publisher:
+            return found
 
         for ext_dir, vscode_type in self.EXTENSION_DIRS:
-            if not os.path.isdir(ext_dir):
-                continue
             try:
-                for entry in os.listdir(ext_dir):
-                    for ext_cfg in wanted:
-                        ext_id = ext_cfg.get('id') or ext_cfg.get('name', '')
-                        if not ext_id or '.' not in ext_id:
+                with os.scandir(ext_dir) as entries:
+                    for entry in entries:
+                        ext_cfg = self._match_extension(entry.name.lower(), wanted_by_publisher)
+                        if not ext_cfg:
                             continue
-                        # Extension folders are publisher.name-version (often lowercase on disk)
-                        prefix = ext_id + '-'
-                        if entry.startswith(prefix) or entry.lower().startswith(prefix.lower()):
-                            info = self._read_extension_info(
-                                os.path.join(ext_dir, entry),
-                                ext_cfg,
-                                vscode_type
-                            )
-                            if info:
-                                found.append(info)
-                            break
-            except PermissionError:
+                        info = self._read_extension_info(entry.path, ext_cfg, vscode_type)
+                        if info:
+                            found.append(info)
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
                 continue
 
         return found
 
+    @staticmethod
+    def _match_extension(
+        name: str,
+        wanted_by_publisher: Dict[str, Dict[str, Dict]]
+    ) -> Optional[Dict]:
+        """
+        Match a lowercased extension folder name against wanted extension IDs.
+        Folders are publisher.name-version (optionally -platform); folders from
+        other publishers are rejected with one lookup. The name itself may
+        contain dashes, so try each dash as the ID/version boundary.
+        """
+        dot = name.find('.')
+        wanted_by_id = wanted_by_publisher.get(name[:dot]) if dot > 0 else None
+        if not wanted_by_id:
+            return None
+        dash = name.find('-', dot + 1)
+        while dash > 0:
+            ext_cfg = wanted_by_id.get(name[:dash])
+            if ext_cfg:
+                return ext_cfg
+            dash = name.find('-', dash + 1)
+        return None
+
     def _read_extension_info(
         self,
         ext_path: str,
@@ -386,19 +753,10 @@ class VSCodeExtensionScanner:
     ) -> Optional[Dict[str, Any]]:
         """Read package.json from extension folder for version and display name."""
         pkg_path = os.path.join(ext_path, 'package.json')
-        if not os.path.isfile(pkg_path):
-            return {
-                'type': 'vscode_extension',
-                'extension_id': ext_cfg.get('id', ''),
-                'name': ext_cfg.get('name', ext_cfg.get('id', '')),
-                'vendor': ext_cfg.get('vendor', ''),
-                'version': 'unknown',
-                'path': ext_path,
-                'vscode_type': vscode_type
-            }
+        # A missing package.json raises OSError and falls back to config info
         try:
-            with open(pkg_path, 'r', encoding='utf-8') as f:
-                pkg = json.load(f)
+            with open(pkg_path, 'rb') as f:
+                pkg = _json_loads(f.read())
             display_name = pkg.get('displayName') or ''
             if '%' in display_name or not display_name:
                 display_name = ext_cfg.get('name') or pkg.get('name', '') or ext_cfg.get('id', '')
@@ -426,11 +784,13 @@ class VSCodeExtensionScanner:
 class AIAppScanner:
     """Main scanner orchestrator"""
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, use_cache: bool = True):
         self.config = ScannerConfig(config_path)
+        # Shared so config paths common to several scanners are read once
+        self.path_cache = PathInfoCache(enabled=use_cache)
         self.app_scanner = ApplicationScanner(self.config)
-        self.cli_scanner = CLIToolScanner(self.config)
-        self.config_scanner = ConfigurationScanner(self.config)
+        self.cli_scanner = CLIToolScanner(self.config, self.path_cache)
+        self.config_scanner = ConfigurationScanner(self.config, self.path_cache)
         self.vscode_scanner = VSCodeExtensionScanner(self.config)
 
     def scan(self) -> Dict[str, Any]:
@@ -440,9 +800,12 @@ class AIAppScanner:
         raw_hostname = platform.node()
         raw_user = os.getenv('USER', 'unknown')
         anonymized_user = _anonymize_identifier(raw_user)
-        real_home = os.path.expanduser('~')
+        real_home = _HOME
         anonymized_home = f"/Users/{anonymized_user}"
 
+        # Each scan reflects the filesystem as it is now
+        self.path_cache.clear()
+
         results = {
             'scan_metadata': {
                 'timestamp': datetime.now().isoformat(),
@@ -451,12 +814,21 @@ class AIAppScanner:
                 'os_version': platform.mac_ver()[0],
                 'config_version': self.config.config.get('version', 'unknown'),
                 'user': anonymized_user
-            },
-            'applications': self.app_scanner.scan(),
-            'cli_tools': self.cli_scanner.scan(),
-            'configurations': self.config_scanner.scan(),
-            'vscode_extensions': self.vscode_scanner.scan()
+            }
+        }
+
+        # The scanners are independent and I/O bound (directory walks and
+        # subprocesses release the GIL), so run them concurrently.
+        scanners = {
+            'applications': self.app_scanner,
+            'cli_tools': self.cli_scanner,
+            'configurations': self.config_scanner,
+            'vscode_extensions': self.vscode_scanner
         }
+        with ThreadPoolExecutor(max_workers=len(scanners)) as executor:
+            futures = {key: executor.submit(scanner.scan) for key, scanner in scanners.items()}
+            for key, future in futures.items():
+                results[key] = future.result()
 
         # Remove username from any paths in output (e.g. /Users/realname -> /Users/anonymized)
         _sanitize_paths_in_output(results, real_home, anonymized_home)
@@ -506,10 +878,15 @@ def main():
         help='Pretty-print JSON output',
         action='store_true'
     )
+    parser.add_argument(
+        '--no-cache',
+        help='Do not share filesystem lookups between scanners',
+        action='store_true'
+    )
 
     args = parser.parse_args()
 
-    scanner = AIAppScanner(args.config)
+    scanner = AIAppScanner(args.config, use_cache=not args.no_cache)
 
     if args.update_config:
         if not scanner.update_config(args.update_url):
@@ -519,15 +896,13 @@ def main():
     results = scanner.scan()
 
     # Output results
-    indent = 2 if args.pretty else None
-    output_json = json.dumps(results, indent=indent)
-
     if args.output:
         with open(args.output, 'w') as f:
-            f.write(output_json)
+            _json_dump(results, f, pretty=args.pretty)
         print(f"Scan results written to: {args.output}")
     else:
-        print(output_json)
+        _json_dump(results, sys.stdout, pretty=args.pretty)
+        sys.stdout.write('\n')
 
     return 0
 
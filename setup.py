@@ -22,6 +22,9 @@ setup(
         "Operating System :: MacOS :: MacOS X",
     ],
     python_requires=">=3.12",
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "aiapp-scanner=aiapp_scanner:main",
@@ -7,6 +7,18 @@ Demonstrates various usage patterns
 import subprocess
 import json
 import sys
+import time
+import io
+import os
+import shutil
+import tempfile
+import contextlib
+import plistlib
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import aiapp_scanner
 
 def run_command(cmd, description):
     """Run a command and display results"""
@@ -37,7 +49,241 @@ def run_command(cmd, description):
         print(f"✗ Error: {e}")
         return False
 
+def run_check(check, description):
+    """Run an in-process check function and display results"""
+    print(f"\n{'='*60}")
+    print(f"TEST: {description}")
+    print('='*60)
+
+    try:
+        check()
+        print("✓ Success")
+        return True
+    except Exception as e:
+        print(f"✗ Failed: {e}")
+        return False
+
+def check_nesting_depth_unterminated_string():
+    """An unterminated string of escaped quotes must not scan quadratically"""
+    data = b'"' + b'\\"' * (aiapp_scanner.ScannerConfig.MAX_REMOTE_CONFIG_BYTES // 2)
+    start = time.perf_counter()
+    depth = aiapp_scanner._json_nesting_depth(data)
+    elapsed = time.perf_counter() - start
+    assert depth == 0, f"depth {depth}"
+    assert elapsed < 2, f"took {elapsed:.2f}s"
+
+def check_nesting_depth_deep_arrays():
+    """Deeply nested arrays are measured without parsing"""
+    depth = aiapp_scanner._json_nesting_depth(b'[' * 200000 + b']' * 200000)
+    assert depth == 200000, f"depth {depth}"
+
+def update_config_from_body(body):
+    """
+    Run ScannerConfig.update_from_url against a file:// URL serving body.
+    Returns (result, stderr output, whether the saved config changed).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, 'config.json')
+        shutil.copy('scanner_config.json', config_path)
+        body_path = Path(tmp, 'remote.json')
+        body_path.write_bytes(body)
+
+        with open(config_path, 'rb') as f:
+            before = f.read()
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), contextlib.redirect_stdout(io.StringIO()):
+            config = aiapp_scanner.ScannerConfig(config_path)
+            result = config.update_from_url(body_path.as_uri())
+        with open(config_path, 'rb') as f:
+            changed = f.read() != before
+    return result, stderr.getvalue(), changed
+
+def check_update_accepts_valid_config():
+    """A well-formed remote config is saved"""
+    body = json.dumps({'applications': [{'name': 'Claude.app', 'vendor': 'Anthropic'}]})
+    result, err, changed = update_config_from_body(body.encode('utf-8'))
+    assert result and changed, err
+
+def check_update_rejects_oversized_config():
+    """Bodies over MAX_REMOTE_CONFIG_BYTES are rejected unparsed"""
+    limit = aiapp_scanner.ScannerConfig.MAX_REMOTE_CONFIG_BYTES
+    body = b'{"applications": [], "pad": "' + b'x' * limit + b'"}'
+    result, err, changed = update_config_from_body(body)
+    assert not result and not changed, err
+    assert 'exceeds' in err, err
+
+def check_update_rejects_deeply_nested_config():
+    """Bodies nested past MAX_REMOTE_CONFIG_DEPTH are rejected unparsed"""
+    depth = aiapp_scanner.ScannerConfig.MAX_REMOTE_CONFIG_DEPTH + 1
+    body = b'{"applications": [], "x": ' + b'[' * depth + b']' * depth + b'}'
+    result, err, changed = update_config_from_body(body)
+    assert not result and not changed, err
+    assert 'too deeply nested' in err, err
+
+def check_update_rejects_bad_field_types():
+    """Entries whose fields have the wrong type are not saved"""
+    bad_configs = [
+        {'applications': [{'name': 1, 'vendor': 'x'}]},
+        {'applications': [], 'config_locations': [{'name': 'n', 'paths': '~/.x'}]},
+        {'cli_tools': [{'name': 'a', 'vendor': 'b', 'version_cmd': 'a --version'}]},
+        {'cli_tools': [{'name': 'a', 'vendor': 'b', 'config_paths': [1]}]},
+    ]
+    for bad in bad_configs:
+        result, err, changed = update_config_from_body(json.dumps(bad).encode('utf-8'))
+        assert not result and not changed, f"accepted {bad}"
+        assert 'Invalid configuration format' in err, err
+
+def check_hostname_strips_local_suffix():
+    """Only a trailing .local is removed, and hostnames are case-insensitive"""
+    anonymize = aiapp_scanner._anonymize_hostname
+    expected = aiapp_scanner._anonymize_identifier('foocloacal')
+    assert anonymize('foocloacal.local') == expected, anonymize('foocloacal.local')
+    assert anonymize('MyMac') == anonymize('mymac.local'), (anonymize('MyMac'), anonymize('mymac.local'))
+
+def check_path_cache_reads_shared_path_once():
+    """Concurrent lookups of one path wait for a single disk read"""
+    cache = aiapp_scanner.PathInfoCache()
+    reads = []
+    describe = cache._describe
+
+    def slow_describe(path):
+        reads.append(path)
+        time.sleep(0.2)
+        return describe(path)
+
+    cache._describe = slow_describe
+    barrier = threading.Barrier(4)
+    results = []
+
+    def lookup():
+        barrier.wait()
+        results.append(cache.get(tempfile.gettempdir()))
+
+    threads = [threading.Thread(target=lookup) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(reads) == 1, f"{len(reads)} reads"
+    assert len(results) == 4 and all(r is results[0] for r in results), results
+
+INFO_PLIST_KEYS = aiapp_scanner.ApplicationScanner.INFO_PLIST_KEYS
+
+def read_plist_keys(plist, sort_keys=True):
+    """Serialize plist as XML and read INFO_PLIST_KEYS back with the SAX reader"""
+    data = plistlib.dumps(plist, fmt=plistlib.FMT_XML, sort_keys=sort_keys)
+    return aiapp_scanner._read_xml_plist_keys(data, INFO_PLIST_KEYS)
+
+def check_plist_ignores_nested_keys():
+    """Same-named keys inside nested dicts and arrays are not top-level values"""
+    plist = {
+        'AANested': {'CFBundleVersion': 'nested', 'CFBundleIdentifier': 'nested'},
+        'AAList': [{'CFBundleShortVersionString': 'nested'}, ['CFBundleVersion', 'x']],
+        'CFBundleIdentifier': 'com.example.app',
+    }
+    values = read_plist_keys(plist)
+    assert values == {'CFBundleIdentifier': 'com.example.app'}, values
+
+def check_plist_skips_non_scalar_values():
+    """Wanted keys holding <dict>, <data> or <date> are omitted"""
+    plist = {
+        'CFBundleShortVersionString': {'CFBundleVersion': 'nested'},
+        'CFBundleVersion': b'\x00\x01',
+        'CFBundleIdentifier': datetime(2024, 1, 2, 3, 4, 5),
+    }
+    values = read_plist_keys(plist)
+    assert values == {}, values
+
+def check_plist_scalar_types():
+    """<integer> and <true/> values convert like plistlib"""
+    plist = {'CFBundleVersion': 42, 'CFBundleShortVersionString': True}
+    values = read_plist_keys(plist)
+    assert values == plist, values
+    assert type(values['CFBundleVersion']) is int, values
+
+def check_plist_missing_key_reads_whole_document():
+    """With a wanted key absent, keys at the very end of the document are found"""
+    plist = {'CFBundleShortVersionString': '1.0'}
+    plist.update({f'Filler{i}': {'CFBundleVersion': str(i)} for i in range(50)})
+    plist['CFBundleIdentifier'] = 'com.example.last'
+    values = read_plist_keys(plist, sort_keys=False)
+    expected = {'CFBundleShortVersionString': '1.0', 'CFBundleIdentifier': 'com.example.last'}
+    assert values == expected, values
+
+def check_plist_matches_plistlib():
+    """Values for INFO_PLIST_KEYS equal plistlib.loads on a realistic Info.plist"""
+    plist = {
+        'CFBundleDevelopmentRegion': 'en',
+        'CFBundleDocumentTypes': [{'CFBundleTypeName': 'Doc', 'CFBundleIdentifier': 'no'}],
+        'CFBundleExecutable': 'Example',
+        'CFBundleIdentifier': 'com.example.app',
+        'CFBundleShortVersionString': '1.2.3 <beta> & more',
+        'CFBundleVersion': '4567',
+        'LSMinimumSystemVersion': '11.0',
+        'NSAppTransportSecurity': {'NSAllowsArbitraryLoads': True},
+    }
+    data = plistlib.dumps(plist, fmt=plistlib.FMT_XML)
+    values = aiapp_scanner._read_xml_plist_keys(data, INFO_PLIST_KEYS)
+    parsed = plistlib.loads(data)
+    expected = {k: parsed[k] for k in INFO_PLIST_KEYS}
+    assert values == expected, values
+
 def main():
+    checks = [
+        {
+            'check': check_nesting_depth_unterminated_string,
+            'description': 'Nesting pre-check on unterminated escaped-quote string'
+        },
+        {
+            'check': check_nesting_depth_deep_arrays,
+            'description': 'Nesting pre-check on deeply nested arrays'
+        },
+        {
+            'check': check_update_accepts_valid_config,
+            'description': 'Config update accepts a valid remote config'
+        },
+        {
+            'check': check_update_rejects_oversized_config,
+            'description': 'Config update rejects an oversized remote config'
+        },
+        {
+            'check': check_update_rejects_deeply_nested_config,
+            'description': 'Config update rejects a deeply nested remote config'
+        },
+        {
+            'check': check_update_rejects_bad_field_types,
+            'description': 'Config update rejects entries with wrong field types'
+        },
+        {
+            'check': check_path_cache_reads_shared_path_once,
+            'description': 'Path cache reads a shared path once under concurrency'
+        },
+        {
+            'check': check_hostname_strips_local_suffix,
+            'description': 'Hostname anonymization strips only the .local suffix'
+        },
+        {
+            'check': check_plist_ignores_nested_keys,
+            'description': 'Info.plist reader ignores nested keys'
+        },
+        {
+            'check': check_plist_skips_non_scalar_values,
+            'description': 'Info.plist reader skips dict, data and date values'
+        },
+        {
+            'check': check_plist_scalar_types,
+            'description': 'Info.plist reader converts integer and boolean values'
+        },
+        {
+            'check': check_plist_missing_key_reads_whole_document,
+            'description': 'Info.plist reader reads to the end when a key is missing'
+        },
+        {
+            'check': check_plist_matches_plistlib,
+            'description': 'Info.plist reader matches plistlib'
+        }
+    ]
+
     tests = [
         {
             'cmd': ['python3', 'aiapp_scanner.py', '--config', 'scanner_config.json', '--pretty'],
@@ -54,6 +300,13 @@ def main():
     ]
 
     results = []
+    for check in checks:
+        success = run_check(check['check'], check['description'])
+        results.append({
+            'description': check['description'],
+            'success': success
+        })
+
     for test in tests:
         success = run_command(test['cmd'], test['description'])
         results.append({